@@ -1,8 +1,8 @@
 # app.py
 import streamlit as st
 import pandas as pd
-from dataclasses import dataclass
-from typing import Dict
+import numpy as np
+from typing import Dict, List, NamedTuple, Sequence, Tuple
 
 st.set_page_config(
     page_title="Energy Unit Converter", page_icon="🔁", layout="centered"
@@ -13,15 +13,16 @@ st.set_page_config(
 # -----------------------------
 DEFAULT_MMBTU_PER_BARREL = 5.8
 DEFAULT_BBL_PER_TONNE = 7.33
+UNITS_ORDER = ["mt", "bbl", "MWh", "TWh", "MMBtu", "TBtu", "Mth"]
 
-@dataclass(frozen=True)
-class Unit:
+class Unit(NamedTuple):
     label: str
     to_mmbtu: float  # factor to convert 1 unit -> MMBtu
 
 # -----------------------------
 # Unit map (all conversions via MMBtu)
 # -----------------------------
+@st.cache_resource(max_entries=64)
 def unit_map(mmbtu_per_barrel: float, bbl_per_tonne: float) -> Dict[str, Unit]:
     return {
         "TBtu": Unit("TBtu", 1_000_000.0),  # 1 TBtu = 1,000,000 MMBtu
@@ -33,10 +34,30 @@ def unit_map(mmbtu_per_barrel: float, bbl_per_tonne: float) -> Dict[str, Unit]:
         "mt": Unit("Metric tonne (crude)", mmbtu_per_barrel * bbl_per_tonne), # tonne = bbl * MMBtu/bbl
     }
 
-def convert(value: float, from_unit: str, to_unit: str, mmbtu_per_barrel: float, bbl_per_tonne: float) -> float:
+def convert_matrix(values: Sequence[float], from_unit: str, targets: Sequence[str], umap: Dict[str, Unit]) -> np.ndarray:
+    # Broadcast every value against every target: shape (len(values), len(targets))
+    v = np.fromiter(values, dtype=np.float64)
+    f = np.array([umap[u].to_mmbtu for u in targets])
+    return v[:, None] * umap[from_unit].to_mmbtu / f[None, :]
+
+@st.cache_data(max_entries=64)
+def build_results_df(value: float, from_unit: str, targets: Tuple[str, ...], mmbtu_per_barrel: float, bbl_per_tonne: float) -> pd.DataFrame:
     umap = unit_map(mmbtu_per_barrel, bbl_per_tonne)
-    value_in_mmbtu = value * umap[from_unit].to_mmbtu
-    return value_in_mmbtu / umap[to_unit].to_mmbtu
+    results_values = convert_matrix((value,), from_unit, targets, umap)[0]
+    df = pd.DataFrame({
+        "Unit": list(targets),
+        "Label": [umap[u].label for u in targets],
+        "Value": results_values,
+    })
+    return df
+
+@st.cache_data(max_entries=64)
+def _reference_rows(mmbtu_per_barrel: float, bbl_per_tonne: float, precision: int) -> List[Dict[str, object]]:
+    umap = unit_map(mmbtu_per_barrel, bbl_per_tonne)
+    return [
+        {"Unit": k, "Label": umap[k].label, "MMBtu per unit": float(f"{umap[k].to_mmbtu:.{precision}g}")}
+        for k in UNITS_ORDER
+    ]
 
 # ---------------- Sidebar (Settings) ----------------
 st.sidebar.title("🔧 Settings")
@@ -77,31 +98,32 @@ st.caption("Convert between **metric tonnes, barrels, MWh, TWh, MMBtu, TBtu, and
 
 # ---------------- Input ----------------
 umap = unit_map(st.session_state.mmbtu_per_barrel, st.session_state.bbl_per_tonne)
-UNITS_ORDER = ["mt", "bbl", "MWh", "TWh", "MMBtu", "TBtu", "Mth"]
 
 value = st.number_input("Value", min_value=0.0, value=1.0, step=1.0)
 from_unit = st.selectbox("From unit", UNITS_ORDER, index=0, format_func=lambda k: umap[k].label)
 
 # ---------------- Compute ----------------
 if value > 0:
-    results = []
-    for u in UNITS_ORDER:
-        results.append({
-            "Unit": u,
-            "Label": umap[u].label,
-            "Value": convert(value, from_unit, u, st.session_state.mmbtu_per_barrel, st.session_state.bbl_per_tonne)
-        })
-    df = pd.DataFrame(results)
-    df["Value"] = df["Value"].map(lambda x: float(f"{x:.{st.session_state.precision}g}"))
+    df = build_results_df(
+        value,
+        from_unit,
+        tuple(UNITS_ORDER),
+        st.session_state.mmbtu_per_barrel,
+        st.session_state.bbl_per_tonne,
+    )
     st.subheader("Converted Values")
-    st.dataframe(df, use_container_width=True)
+    st.dataframe(
+        df.style.format({"Value": f"{{:.{st.session_state.precision}g}}"}),
+        use_container_width=True,
+    )
 
 # ---------------- Reference ----------------
 with st.expander("📘 Reference factors (via MMBtu)"):
-    ref = pd.DataFrame({
-        "Unit": UNITS_ORDER,
-        "Label": [umap[k].label for k in UNITS_ORDER],
-        "MMBtu per unit": [umap[k].to_mmbtu for k in UNITS_ORDER],
-    })
-    ref["MMBtu per unit"] = ref["MMBtu per unit"].map(lambda x: float(f"{x:.{st.session_state.precision}g}"))
-    st.dataframe(ref, use_container_width=True)
+    st.dataframe(
+        _reference_rows(
+            st.session_state.mmbtu_per_barrel,
+            st.session_state.bbl_per_tonne,
+            st.session_state.precision,
+        ),
+        use_container_width=True,
+    )